@@ -5,8 +5,9 @@ import os
 def before_all(context):
     # Configura nível de logging padrão para DEBUG quando executar behave localmente
     logging.basicConfig(level=logging.DEBUG, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
-    # Opcional: também ajusta nivel para logger do módulo pages.product_page
-    logging.getLogger("pages.product_page").setLevel(logging.DEBUG)
+    # Opcional: também ajusta nivel para os loggers de pages.* (pages.product_page e o
+    # gravador de artifacts pages._artifact_writer, que registra os "salvo em")
+    logging.getLogger("pages").setLevel(logging.DEBUG)
 
 def after_scenario(context, scenario):
     """
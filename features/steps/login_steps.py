@@ -220,7 +220,7 @@ def step_verify_home_screen(context):
         # Tenta qualquer dos locators; se algum for encontrado retorna imediatamente
         found_locator, element = wait_for_any_locator(context.driver, locators_to_try, per_locator_timeout)
         # Se desejarmos podemos logar qual locator obteve sucesso (útil para debugging)
-        # Ex.: logger.debug(f"Home screen detected by locator {found_locator}")
+        # Ex.: logger.debug("Home screen detected by locator %s", found_locator)  (formatação adiada)
         return
     except TimeoutException as exc:
         # Ao falhar, captura artifacts para diagnóstico, se possível usando o Page Object
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+<summary>
+Gravador assíncrono de artifacts de diagnóstico (screenshot/page_source).
+Os bytes já capturados do driver são enfileirados num queue.Queue e gravados em disco
+por uma thread daemon iniciada no primeiro uso, tirando a latência de disco do step.
+Cada item da fila é um lote (submit_many) e gera um único registro de log debug.
+flush() (também registrado em atexit) aguarda a gravação de tudo o que foi enfileirado.
+</summary>
+"""
+from typing import Optional, Sequence, Set, Tuple
+import atexit
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Itens: lotes de (rótulo para log, caminho absoluto, bytes a gravar)
+_Artifact = Tuple[str, str, bytes]
+_ARTIFACT_Q: "queue.Queue[Tuple[_Artifact, ...]]" = queue.Queue()
+_WORKER: Optional[threading.Thread] = None
+_WORKER_LOCK = threading.Lock()
+# Diretórios já criados neste processo (makedirs uma única vez por diretório; ver ensure_dir)
+_CREATED_DIRS: Set[str] = set()
+
+
+def ensure_dir(directory: str) -> None:
+    """
+    <summary>
+    Cria 'directory' (makedirs) apenas na primeira vez que é pedido neste processo,
+    evitando stat/mkdir repetidos a cada captura. Se o diretório for apagado depois,
+    _write_artifact retira-o da memória e chama ensure_dir de novo.
+    </summary>
+    <param name="directory">Caminho absoluto do diretório</param>
+    <returns>None</returns>
+    """
+    if directory not in _CREATED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _CREATED_DIRS.add(directory)
+
+
+def _write_artifact(label: str, path: str, data: bytes) -> bool:
+    """
+    <summary>
+    Grava 'data' em 'path' com um único write() sem buffer. Não propaga exceções; apenas registra.
+    </summary>
+    <param name="label">Rótulo usado nas mensagens de log (ex.: "Screenshot")</param>
+    <param name="path">Caminho absoluto do ficheiro</param>
+    <param name="data">Conteúdo já codificado</param>
+    <returns>True se gravou; False se falhou</returns>
+    """
+    directory = os.path.dirname(path)
+    try:
+        ensure_dir(directory)
+        try:
+            f = open(path, "wb", buffering=0)
+        except FileNotFoundError:
+            # Diretório removido depois de memoizado (limpeza de testes/utilizador): recria uma vez
+            _CREATED_DIRS.discard(directory)
+            ensure_dir(directory)
+            f = open(path, "wb", buffering=0)
+        with f:
+            f.write(data)
+        return True
+    except Exception as exc:
+        logger.exception("artifact_writer: Falha ao gravar %s em '%s': %s", label, path, exc)
+        return False
+
+
+def _write_batch(batch: Sequence[_Artifact]) -> None:
+    # Grava o lote e resume os sucessos num único registro debug (falhas já foram registradas)
+    saved = [(label, path) for label, path, data in batch if _write_artifact(label, path, data)]
+    if saved and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("artifact_writer: %s", "; ".join(f"{label} salvo em {path}" for label, path in saved))
+
+
+def _worker_loop() -> None:
+    # Consome a fila indefinidamente; task_done permite que flush() use Queue.join()
+    while True:
+        batch = _ARTIFACT_Q.get()
+        try:
+            _write_batch(batch)
+        finally:
+            _ARTIFACT_Q.task_done()
+
+
+def _ensure_worker() -> None:
+    global _WORKER
+    if _WORKER is not None and _WORKER.is_alive():
+        return
+    with _WORKER_LOCK:
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(target=_worker_loop, name="artifact-writer", daemon=True)
+            _WORKER.start()
+
+
+def submit_many(items: Sequence[_Artifact]) -> None:
+    """
+    <summary>
+    Enfileira vários artifacts como um único lote (uma entrada na fila, um registro de log).
+    Lotes vazios são ignorados.
+    </summary>
+    <param name="items">Sequência de (rótulo, caminho absoluto, bytes)</param>
+    <returns>None</returns>
+    """
+    if not items:
+        return
+    _ensure_worker()
+    _ARTIFACT_Q.put(tuple(items))
+
+
+def flush() -> None:
+    """
+    <summary>
+    Bloqueia até que todos os artifacts enfileirados tenham sido gravados.
+    </summary>
+    <returns>None</returns>
+    """
+    if _WORKER is None:
+        return
+    _ARTIFACT_Q.join()
+
+
+# Garante que nada fique por gravar quando o processo (pytest/behave) terminar
+atexit.register(flush)
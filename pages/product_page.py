@@ -9,14 +9,86 @@ mecanismo de captura de artifacts (screenshot + page_source) e logging detalhado
 from typing import List, Tuple
 import time
 import os
+import itertools
 import logging
+import xml.etree.ElementTree as ET
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from appium.webdriver.common.appiumby import AppiumBy
+from pages import _artifact_writer
 
 # Logger do módulo — herdará configuração definida pela suíte de testes / behave
 logger = logging.getLogger(__name__)
 
+# Textos de cabeçalho da tela de catálogo ignorados por get_all_product_titles (lookup O(1))
+_HEADER_TITLES = frozenset({"", "products", "product"})
+
+# Textos que não são títulos de produto na acumulação de collect_product_titles (lookup O(1))
+_COLLECT_HEADER_LIKE = frozenset({"", "products", "product", "title", "catalog"})
+
+# Comprimento máximo de um cabeçalho: textos mais longos (títulos reais) dispensam o .lower()
+_HEADER_MAX_LEN = max(len(h) for h in _COLLECT_HEADER_LIKE | _HEADER_TITLES)
+
+
+def _is_header_like(t: str) -> bool:
+    """
+    <summary>
+    Indica se o texto é vazio ou um cabeçalho (ex.: "Products") em vez de um título de produto.
+    </summary>
+    <param name="t">Texto lido da viewport</param>
+    <returns>True se deve ser ignorado na acumulação</returns>
+    """
+    if not t:
+        return True
+    s = t.strip()
+    return len(s) <= _HEADER_MAX_LEN and s.lower() in _COLLECT_HEADER_LIKE
+
+
+def _is_header_title(t: str) -> bool:
+    """
+    <summary>
+    Variante usada por get_all_product_titles: apenas vazio/"Products"/"Product" contam como cabeçalho.
+    </summary>
+    <param name="t">Texto lido de um productTV</param>
+    <returns>True se o texto não é um título válido</returns>
+    """
+    if not t:
+        return True
+    s = t.strip()
+    return len(s) <= _HEADER_MAX_LEN and s.lower() in _HEADER_TITLES
+
+
+def _parse_titles_from_source(xml_str: str) -> List[str]:
+    """
+    <summary>
+    Extrai, em processo, os títulos de produto de um page_source (hierarquia XML do UiAutomator2):
+    nós com resource-id productTV e o primeiro TextView irmão seguinte de cada productIV,
+    em ordem de documento e sem cabeçalhos (ex.: "Products").
+    </summary>
+    <param name="xml_str">Conteúdo de driver.page_source</param>
+    <returns>Lista de títulos (vazia se nada for encontrado)</returns>
+    <raises>xml.etree.ElementTree.ParseError se o XML for inválido</raises>
+    """
+    root = ET.fromstring(xml_str.encode("utf-8"))
+    # TextViews que seguem imediatamente (primeiro TextView irmão) uma imagem productIV
+    image_siblings = set()
+    for parent in root.iter():
+        pending_image = False
+        for child in parent:
+            if child.get("resource-id", "").endswith("productIV"):
+                pending_image = True
+            elif pending_image and child.get("class") == "android.widget.TextView":
+                image_siblings.add(child)
+                pending_image = False
+
+    titles: List[str] = []
+    for node in root.iter():
+        if node in image_siblings or node.get("resource-id", "").endswith("productTV"):
+            text = (node.get("text") or "").strip()
+            if not _is_header_title(text):
+                titles.append(text)
+    return titles
+
 
 class ProductPage:
     """
@@ -37,6 +109,29 @@ class ProductPage:
     # UiSelector base para localizar imagens dos produtos (productIV).
     # Para selecionar por índice: use f"{PRODUCT_IMAGE_UIAUTOMATOR_BASE}.instance(N)"
     PRODUCT_IMAGE_UIAUTOMATOR_BASE: str = 'new UiSelector().resourceId("com.saucelabs.mydemoapp.android:id/productIV")'
+    PRODUCT_IMAGE_UIAUTOMATOR_INSTANCE_FMT: str = PRODUCT_IMAGE_UIAUTOMATOR_BASE + ".instance({})"
+    # Selectors .instance(N) pré-calculados para os índices usuais (0..63)
+    _INSTANCE_SELECTORS: Tuple[str, ...] = tuple(map(PRODUCT_IMAGE_UIAUTOMATOR_INSTANCE_FMT.format, range(64)))
+
+    # XPaths globais productIV -> TextView usados no fallback de get_all_product_titles, em ordem de preferência.
+    # As variantes por resource-id e por content-desc da mesma relação são fundidas num único predicado
+    # ('or'), de modo que cada relação custa uma só chamada ao Appium.
+    _IV_MATCH: str = "//android.widget.ImageView[@resource-id='com.saucelabs.mydemoapp.android:id/productIV' or @content-desc='Product Image']"
+    GLOBAL_TITLE_XPATHS: Tuple[str, ...] = (
+        # sibling direto
+        f"{_IV_MATCH}/following-sibling::android.widget.TextView",
+        # primeiro TextView seguindo a image (global)
+        "(//android.widget.ImageView[@resource-id='com.saucelabs.mydemoapp.android:id/productIV'])/following::android.widget.TextView[1]",
+        # TextView no mesmo parent
+        f"{_IV_MATCH}/parent::*/android.widget.TextView",
+        # TextView productTV dentro do ancestor viewgroup
+        "//android.widget.ImageView[@resource-id='com.saucelabs.mydemoapp.android:id/productIV']/ancestor::android.view.ViewGroup//android.widget.TextView[@resource-id='com.saucelabs.mydemoapp.android:id/productTV']",
+    )
+
+    # Sufixo único dos ficheiros de _capture_debug_artifacts: pid + contador monotónico partilhado
+    # pelas instâncias (evita time.time() + formatação por captura e colisões no mesmo segundo).
+    # O pid é lido a cada captura: um valor fixado no import repetir-se-ia em processos fork
+    _capture_counter = itertools.count()
 
     def __init__(self, driver: WebDriver, default_wait_seconds: int = 5) -> None:
         """
@@ -55,40 +150,44 @@ class ProductPage:
         """
         <summary>
         Captura artifacts de diagnóstico no diretório ./artifacts:
-          - screenshot (chama driver.get_screenshot_as_file)
-          - page_source (escreve driver.page_source em XML)
+          - screenshot (bytes via driver.get_screenshot_as_png; get_screenshot_as_file se ausente)
+          - page_source (via driver.page_source, codificado em UTF-8, gravado como XML)
+        Apenas a leitura do driver é síncrona: a gravação em disco é enfileirada como um único lote
+        no gravador em background (pages._artifact_writer); use _flush_artifacts() para aguardá-la.
+        Sucessos geram um único registro debug por captura; avisos e falhas continuam individuais.
         Não propaga exceções se falhar; apenas registra.
         </summary>
         <param name="prefix">Prefixo para os ficheiros gerados</param>
         <returns>None</returns>
         """
         artifacts_dir = os.path.join(os.getcwd(), "artifacts")
-        try:
-            os.makedirs(artifacts_dir, exist_ok=True)
-        except Exception as exc:
-            logger.exception("Não foi possível criar artifacts_dir '%s': %s", artifacts_dir, exc)
-            return
-
-        ts = int(time.time())
-        png_path = os.path.join(artifacts_dir, f"{prefix}_{ts}.png")
-        xml_path = os.path.join(artifacts_dir, f"{prefix}_{ts}.xml")
+        stem = f"{prefix}_{os.getpid()}_{next(self._capture_counter)}"
+        png_path = os.path.join(artifacts_dir, stem + ".png")
+        xml_path = os.path.join(artifacts_dir, stem + ".xml")
+        # Artifacts a enfileirar (um lote; o gravador resume os sucessos num único log debug)
+        pending: List[Tuple[str, str, bytes]] = []
 
-        # Tenta salvar screenshot
+        # Tenta obter o screenshot (bytes em memória; uma única gravação feita pelo gravador)
         try:
-            ok = False
             try:
-                ok = bool(self.driver.get_screenshot_as_file(png_path))
-            except TypeError:
-                # Alguns drivers/mocks retornam None — consideramos sucesso se não lançar
-                ok = True
-            if ok:
-                logger.debug("_capture_debug_artifacts: Screenshot salvo em %s", png_path)
+                png = self.driver.get_screenshot_as_png()
+            except AttributeError:
+                # Drivers sem get_screenshot_as_png: o próprio driver grava o ficheiro (síncrono).
+                # makedirs direto (não o memo de ensure_dir): ./artifacts pode ter sido apagado depois
+                os.makedirs(artifacts_dir, exist_ok=True)
+                if self.driver.get_screenshot_as_file(png_path) is False:
+                    logger.warning("_capture_debug_artifacts: driver.get_screenshot_as_file retornou False ao salvar em %s", png_path)
+                else:
+                    logger.debug("_capture_debug_artifacts: Screenshot salvo em %s", png_path)
             else:
-                logger.warning("_capture_debug_artifacts: driver.get_screenshot_as_file retornou False ao salvar em %s", png_path)
+                if isinstance(png, (bytes, bytearray)) and png:
+                    pending.append(("Screenshot", png_path, bytes(png)))
+                else:
+                    logger.warning("_capture_debug_artifacts: driver.get_screenshot_as_png não retornou bytes; screenshot não gravado em %s", png_path)
         except Exception as exc:
             logger.exception("_capture_debug_artifacts: Falha ao salvar screenshot em '%s': %s", png_path, exc)
 
-        # Tenta salvar page_source
+        # Tenta obter o page_source
         try:
             src = ""
             try:
@@ -97,17 +196,24 @@ class ProductPage:
                 logger.exception("_capture_debug_artifacts: Falha ao obter page_source: %s", exc)
                 src = ""
             if src:
-                try:
-                    with open(xml_path, "w", encoding="utf-8") as f:
-                        f.write(src)
-                    logger.debug("_capture_debug_artifacts: Page source salvo em %s", xml_path)
-                except Exception as exc:
-                    logger.exception("_capture_debug_artifacts: Falha ao gravar page_source em '%s': %s", xml_path, exc)
+                # Codifica o documento inteiro em memória; o gravador faz um único write()
+                pending.append(("Page source", xml_path, src.encode("utf-8")))
             else:
                 logger.warning("_capture_debug_artifacts: page_source vazio; não gravado em %s", xml_path)
         except Exception:
             logger.exception("_capture_debug_artifacts: Erro inesperado ao tentar salvar page_source (ignorado).")
 
+        _artifact_writer.submit_many(pending)
+
+    def _flush_artifacts(self) -> None:
+        """
+        <summary>
+        Aguarda a gravação em disco de todos os artifacts enfileirados por _capture_debug_artifacts.
+        </summary>
+        <returns>None</returns>
+        """
+        _artifact_writer.flush()
+
     def _find_product_elements(self) -> List[WebElement]:
         """
         <summary>
@@ -156,8 +262,11 @@ class ProductPage:
         <param name="index">Índice 0-based</param>
         <returns>WebElement clicado</returns>
         """
-        # Constrói selector UiSelector com instance (0-based)
-        ui_selector = f"{self.PRODUCT_IMAGE_UIAUTOMATOR_BASE}.instance({index})"
+        # Selector UiSelector com instance (0-based): pré-calculado para índices pequenos
+        if 0 <= index < len(self._INSTANCE_SELECTORS):
+            ui_selector = self._INSTANCE_SELECTORS[index]
+        else:
+            ui_selector = self.PRODUCT_IMAGE_UIAUTOMATOR_INSTANCE_FMT.format(index)
         logger.debug("select_product_by_image_index: buscando imagem com UiSelector '%s'", ui_selector)
         elem = self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, ui_selector)
         elem.click()
@@ -208,11 +317,34 @@ class ProductPage:
         logger.debug("_extract_title_from_image_element: não encontrou título relativo")
         return ""
 
+    def _titles_from_page_source(self) -> List[str]:
+        """
+        <summary>
+        Lê driver.page_source uma vez e extrai os títulos com _parse_titles_from_source.
+        Retorna lista vazia (para que o chamador use a estratégia por elementos) quando o
+        page_source não está disponível, não é texto, é inválido ou não contém títulos.
+        </summary>
+        <returns>Lista de títulos ou lista vazia</returns>
+        """
+        try:
+            src = self.driver.page_source
+        except Exception:
+            logger.debug("get_all_product_titles: page_source indisponível", exc_info=True)
+            return []
+        if not isinstance(src, str) or not src:
+            return []
+        try:
+            return _parse_titles_from_source(src)
+        except ET.ParseError:
+            logger.debug("get_all_product_titles: page_source não é XML válido; usando busca por elementos", exc_info=True)
+            return []
+
     def get_all_product_titles(self) -> List[str]:
         """
         <summary>
         Retorna os títulos (strings) de todos os produtos visíveis.
         Estratégia:
+          0) extrai os títulos do page_source (uma única chamada ao driver), se disponível;
           1) tenta coletar elements productTV por ID;
           2) se resultado parecer header-like/insuficiente -> ativa fallback:
              2.a) tenta localizar image elements via UiSelector(productIV);
@@ -226,6 +358,12 @@ class ProductPage:
         <returns>Lista de títulos visíveis (pode conter strings vazias se não extraídas)</returns>
         """
         logger.debug("get_all_product_titles: início da coleta de títulos")
+        # 0) caminho rápido: um único page_source analisado em processo (sem round-trip por elemento)
+        fast_titles = self._titles_from_page_source()
+        if fast_titles:
+            logger.debug("get_all_product_titles: títulos extraídos do page_source %s", fast_titles)
+            return fast_titles
+
         # 1) tentativa direta por ID (productTV)
         try:
             elems = self.driver.find_elements(self.PRODUCT_TITLE[0], self.PRODUCT_TITLE[1])
@@ -243,7 +381,7 @@ class ProductPage:
         logger.debug("get_all_product_titles: títulos iniciais coletados %s", titles)
 
         # Detecta header-like (p.ex. apenas "Products" listado)
-        header_like = (len(titles) <= 1) and any(t.strip().lower() in ("products", "product", "") for t in titles)
+        header_like = (len(titles) <= 1) and any(_is_header_title(t) for t in titles)
         if not titles or header_like:
             logger.debug("get_all_product_titles: fallback ativado (header_like=%s, count_titles=%d)", header_like, len(titles))
 
@@ -260,22 +398,8 @@ class ProductPage:
                 return [] if header_like else titles
 
             # ---------- NOVO: busca global por XPATHs relacionando productIV -> TextView ----------
-            # usa resource-id e content-desc observados no inspector
-            product_iv_rid = "com.saucelabs.mydemoapp.android:id/productIV"
-            product_tv_rid = "com.saucelabs.mydemoapp.android:id/productTV"
-            xpath_candidates = [
-                # sibling direto
-                f"//android.widget.ImageView[@resource-id='{product_iv_rid}']/following-sibling::android.widget.TextView",
-                # sibling via content-desc (fallback quando resource-id pode variar)
-                f"//android.widget.ImageView[@content-desc='Product Image']/following-sibling::android.widget.TextView",
-                # primeiro TextView seguindo a image (global)
-                f"(//android.widget.ImageView[@resource-id='{product_iv_rid}'])/following::android.widget.TextView[1]",
-                # TextView no mesmo parent
-                f"//android.widget.ImageView[@resource-id='{product_iv_rid}']/parent::*/android.widget.TextView",
-                f"//android.widget.ImageView[@content-desc='Product Image']/parent::*/android.widget.TextView",
-                # TextView productTV dentro do ancestor viewgroup
-                f"//android.widget.ImageView[@resource-id='{product_iv_rid}']/ancestor::android.view.ViewGroup//android.widget.TextView[@resource-id='{product_tv_rid}']",
-            ]
+            # usa resource-id e content-desc observados no inspector (GLOBAL_TITLE_XPATHS)
+            xpath_candidates = self.GLOBAL_TITLE_XPATHS
 
             # Executa as buscas globais no driver; é mais confiável do que buscas relativas a partir do elemento em muitos drivers
             try:
@@ -287,7 +411,7 @@ class ProductPage:
                         for fe in found:
                             try:
                                 txt = str(fe.text or "").strip()
-                                if txt and txt.lower() not in ("products", "product", ""):
+                                if not _is_header_title(txt):
                                     found_texts.append(txt)
                             except Exception:
                                 continue
@@ -316,14 +440,8 @@ class ProductPage:
                 except Exception:
                     title_texts.append("")
 
-            def _is_header(t: str) -> bool:
-                if not t:
-                    return True
-                s = t.strip().lower()
-                return s in ("", "products", "product",)
-
             # se existirem textos válidos suficientes, preferimos esses
-            valid_title_texts = [t for t in title_texts if not _is_header(t)]
+            valid_title_texts = [t for t in title_texts if not _is_header_title(t)]
             if len(valid_title_texts) >= len(img_elems):
                 logger.debug("get_all_product_titles: usando title_elems válidos (count=%d) em vez de extração por imagem", len(valid_title_texts))
                 return valid_title_texts[:len(img_elems)]
@@ -332,7 +450,7 @@ class ProductPage:
             titles = []
             for i in range(len(img_elems)):
                 chosen = ""
-                if i < len(title_texts) and not _is_header(title_texts[i]):
+                if i < len(title_texts) and not _is_header_title(title_texts[i]):
                     chosen = title_texts[i]
                     logger.debug("get_all_product_titles: index %d -> usando title_elems text '%s'", i, chosen)
                 else:
@@ -448,11 +566,13 @@ class ProductPage:
         required = max(index_a, index_b) + 1
         cached = getattr(self, "_last_collected_titles", None)
         if isinstance(cached, list) and len(cached) >= required:
-            logger.debug("compare_products: usando cache com %d títulos", len(cached))
-            accumulated_titles = cached
-        else:
-            logger.debug("compare_products: coletando ao menos %d títulos", required)
-            accumulated_titles = self.collect_product_titles(min_count=required, max_scrolls=8, wait_after_scroll=self.default_wait_seconds * 0.1)
+            # Cache suficiente: retorna direto (indexação + comparação), sem cópia e sem tocar no driver
+            title_a = cached[index_a]
+            title_b = cached[index_b]
+            return {"product_a": title_a, "product_b": title_b, "equal": (title_a == title_b)}
+
+        logger.debug("compare_products: coletando ao menos %d títulos", required)
+        accumulated_titles = self.collect_product_titles(min_count=required, max_scrolls=8, wait_after_scroll=self.default_wait_seconds * 0.1)
 
         logger.debug("compare_products: accumulated_titles=%s", accumulated_titles)
         if len(accumulated_titles) < required:
@@ -488,18 +608,10 @@ class ProductPage:
         accumulated: List[str] = []
         consecutive_no_new = 0
 
-        def _is_header_like(t: str) -> bool:
-            if not t:
-                return True
-            s = t.strip().lower()
-            return s in ("", "products", "product", "title", "catalog")
-
-        # coleta inicial
+        # coleta inicial (uma única passagem; duplicatas entre viewports são mantidas)
         visible = self.get_all_product_titles()
         logger.debug("collect_product_titles: títulos visíveis iniciais: %s", visible)
-        for t in visible:
-            if not _is_header_like(t):
-                accumulated.append(t)
+        accumulated.extend(t for t in visible if not _is_header_like(t))
 
         if len(accumulated) >= min_count:
             self._last_collected_titles = list(accumulated)
@@ -513,14 +625,13 @@ class ProductPage:
             if not scrolled:
                 logger.debug("collect_product_titles: _scroll_forward retornou False; abortando")
                 break
-
-            time.sleep(wait_after_scroll)
+            # Aguarda a viewport assentar; com espera nula nem chama time.sleep (evita um yield do scheduler)
+            if wait_after_scroll > 0:
+                time.sleep(wait_after_scroll)
             visible = self.get_all_product_titles()
             logger.debug("collect_product_titles: visíveis após scroll #%d -> %s", attempt + 1, visible)
             before = len(accumulated)
-            for t in visible:
-                if not _is_header_like(t):
-                    accumulated.append(t)
+            accumulated.extend(t for t in visible if not _is_header_like(t))
             added = len(accumulated) - before
             logger.debug("collect_product_titles: adicionados nesta iteração: %d (total agora %d)", added, len(accumulated))
 
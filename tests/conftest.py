@@ -18,7 +18,26 @@ Aqui garantimos que login_steps esteja importado e registrado sob aliases
 necessários, evitando erros de patch por nomes de módulos não encontrados.
 </summary>
 """
+import pytest
+from unittest.mock import MagicMock
 from tests.utils.alias_helper import register_login_steps_aliases
+from tests.utils import fakes
+from tests.utils.dummies import DummyContext
+from pages.product_page import ProductPage
+
+# Contexto do Behave partilhado pelos testes de steps e reiniciado pela fixture ctx
+_CTX = DummyContext()
+
+
+def pytest_configure(config):
+    """
+    <summary>
+    Registra o marker real_sleep (testes que precisam do time.sleep verdadeiro).
+    </summary>
+    <param name="config">Configuração do pytest</param>
+    <returns>None</returns>
+    """
+    config.addinivalue_line("markers", "real_sleep: não substitui time.sleep por no-op neste teste")
 
 
 def pytest_sessionstart(session):
@@ -36,3 +55,63 @@ def pytest_sessionstart(session):
     except Exception as exc:
         # Falhar cedo com mensagem clara — pytest exibirá o erro de import se algo estiver mal
         raise RuntimeError(f"Falha ao registrar alias para login_steps: {exc}") from exc
+
+
+@pytest.fixture(scope="session")
+def login_steps_module():
+    """
+    <summary>
+    Fornece features.steps.login_steps por import normal: o ROOT já está no sys.path e o
+    cache de imports do Python serve os acessos seguintes (sem spec/loader/exec por teste).
+    </summary>
+    <returns>O módulo de steps importado</returns>
+    """
+    import features.steps.login_steps as login_steps
+    return login_steps
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(request, monkeypatch):
+    """
+    <summary>
+    Substitui time.sleep por no-op em todos os testes (ex.: wait_after_scroll em
+    collect_product_titles), exceto nos marcados com @pytest.mark.real_sleep.
+    </summary>
+    """
+    if request.node.get_closest_marker("real_sleep") is None:
+        monkeypatch.setattr("time.sleep", lambda *_: None)
+
+
+@pytest.fixture
+def make_el():
+    """
+    <summary>
+    Fábrica de elementos fake (FakeElement com __slots__) partilhada pelos testes de ProductPage.
+    </summary>
+    <returns>Callable make_el(text="", child=None)</returns>
+    """
+    return fakes.make_el
+
+
+@pytest.fixture
+def product_page():
+    """
+    <summary>
+    ProductPage sobre um driver MagicMock novo, para testes que configuram o driver por side_effect.
+    </summary>
+    <returns>Tupla (ProductPage, driver)</returns>
+    """
+    driver = MagicMock()
+    return ProductPage(driver), driver
+
+
+@pytest.fixture
+def ctx():
+    """
+    <summary>
+    Contexto do Behave (DummyContext) partilhado pelos testes de steps, reiniciado para o teste corrente.
+    </summary>
+    <returns>DummyContext sem driver/login_page atribuídos</returns>
+    """
+    _CTX.reset()
+    return _CTX
@@ -9,6 +9,7 @@ import sys
 import importlib.util
 import os
 import unittest
+from unittest.mock import patch
 
 from tests.utils import alias_helper
 
@@ -30,6 +31,26 @@ class TestAliasHelper(unittest.TestCase):
         # Checagem adicional: os dois nomes apontam para o mesmo objeto módulo
         self.assertIs(sys.modules["features.steps.login_steps"], sys.modules["login_steps_mod"])
 
+    def test_register_login_steps_aliases_warm_path_skips_import(self):
+        """
+        <summary>
+        Com o módulo já em sys.modules, a chamada não passa por importlib.import_module.
+        </summary>
+        """
+        mod = alias_helper.register_login_steps_aliases()
+        with patch.object(alias_helper.importlib, "import_module", side_effect=AssertionError("import inesperado")):
+            self.assertIs(alias_helper.register_login_steps_aliases(), mod)
+
+    def test_register_login_steps_aliases_replaces_stale_alias(self):
+        """
+        <summary>
+        Um alias 'login_steps_mod' apontando para outro objeto é substituído pelo módulo resolvido.
+        </summary>
+        """
+        with patch.dict(sys.modules, {"login_steps_mod": object()}):
+            mod = alias_helper.register_login_steps_aliases()
+            self.assertIs(sys.modules["login_steps_mod"], mod)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 import unittest
 from unittest.mock import Mock, patch
-from selenium.common.exceptions import TimeoutException
 from pages.login_page import LoginPage
 
 class DummyElement:
+    __slots__ = ("clicked", "cleared", "sent_keys", "text")
+
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self.clicked = False
         self.cleared = False
         self.sent_keys = None
@@ -24,17 +28,30 @@ class DummyElement:
         return True
 
 class TestLoginPageNav(unittest.TestCase):
+    # Sequências de elementos pré-construídas no carregamento da classe (reiniciadas em setUp):
+    # menu, item Log In, username, password, botão login
+    _LOGIN_VIA_MENU_ELEMS = tuple(DummyElement() for _ in range(5))
+    # menu e item Log In reutilizam os dois primeiros elementos da sequência acima
+    _MENU_ELEMS = _LOGIN_VIA_MENU_ELEMS[:2]
+
+    @classmethod
+    def setUpClass(cls):
+        # Template de driver criado uma vez por classe; reiniciado em cada setUp
+        cls._driver_template = Mock(spec_set=["find_element", "find_elements", "hide_keyboard", "get_screenshot_as_file", "page_source"])
+
     def setUp(self):
-        self.mock_driver = Mock()
-        self.page = LoginPage(self.mock_driver, default_wait_seconds=0.1)
+        self.mock_driver = self._driver_template
+        self.mock_driver.reset_mock(return_value=True, side_effect=True)
+        self.page = LoginPage(self.mock_driver, default_wait_seconds=0)
+        for el in self._LOGIN_VIA_MENU_ELEMS:
+            el.reset()
 
     @patch("pages.login_page.WebDriverWait")
     def test_open_menu_and_open_login_from_menu(self, mock_wait):
         # Simula elementos retornados para o menu e o item Log In
-        menu_el = DummyElement()
-        login_item_el = DummyElement()
+        menu_el, login_item_el = self._MENU_ELEMS
         # WebDriverWait().until será chamado duas vezes: menu, login item
-        mock_wait.return_value.until.side_effect = [menu_el, login_item_el]
+        mock_wait.return_value.until.side_effect = iter(self._MENU_ELEMS)
 
         # Abre menu e escolhe Login
         self.page.open_menu()
@@ -46,12 +63,8 @@ class TestLoginPageNav(unittest.TestCase):
     @patch("pages.login_page.WebDriverWait")
     def test_login_via_menu_sequence(self, mock_wait):
         # Simula: menu, login item, username field, password field, login button
-        menu_el = DummyElement()
-        login_item_el = DummyElement()
-        username_el = DummyElement()
-        password_el = DummyElement()
-        login_btn_el = DummyElement()
-        mock_wait.return_value.until.side_effect = [menu_el, login_item_el, username_el, password_el, login_btn_el]
+        menu_el, login_item_el, username_el, password_el, login_btn_el = self._LOGIN_VIA_MENU_ELEMS
+        mock_wait.return_value.until.side_effect = iter(self._LOGIN_VIA_MENU_ELEMS)
 
         self.page.login_via_menu("visual@example.com", "10203040")
 
@@ -66,6 +79,7 @@ class TestLoginPageNav(unittest.TestCase):
 
     @patch("pages.login_page.WebDriverWait")
     def test_wait_timeout_captures_artifacts(self, mock_wait):
+        from selenium.common.exceptions import TimeoutException
         mock_wait.return_value.until.side_effect = TimeoutException()
         with patch.object(self.page, "_capture_debug_artifacts") as mock_capture:
             with self.assertRaises(TimeoutException):
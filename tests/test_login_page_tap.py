@@ -1,19 +1,30 @@
 #!/usr/bin/env python3
 import unittest
 from unittest.mock import Mock, patch
-from selenium.common.exceptions import TimeoutException
 from pages.login_page import LoginPage
 
 class DummyElem:
+    __slots__ = ("clicked",)
+
     def __init__(self):
         self.clicked = False
     def click(self):
         self.clicked = True
 
 class TestLoginTap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from selenium.common.exceptions import TimeoutException
+        # Sequência "timeout e depois elemento" pré-construída uma vez por classe
+        cls._TIMEOUT_THEN_ELEM = (TimeoutException(), DummyElem())
+        # Template de driver criado uma vez por classe; reiniciado em cada setUp
+        cls._driver_template = Mock(spec_set=["find_element", "find_elements", "hide_keyboard", "get_screenshot_as_file", "page_source"])
+
     def setUp(self):
-        self.mock_driver = Mock()
-        self.page = LoginPage(self.mock_driver, default_wait_seconds=0.1)
+        self.mock_driver = self._driver_template
+        self.mock_driver.reset_mock(return_value=True, side_effect=True)
+        self.page = LoginPage(self.mock_driver, default_wait_seconds=0)
+        self._TIMEOUT_THEN_ELEM[1].clicked = False
 
     @patch("pages.login_page.WebDriverWait")
     def test_tap_login_success_direct(self, mock_wait):
@@ -26,9 +37,9 @@ class TestLoginTap(unittest.TestCase):
     @patch("pages.login_page.WebDriverWait")
     def test_tap_login_timeout_then_scroll_success(self, mock_wait):
         # Primeiro until -> TimeoutException, second until -> returns element
-        elem = DummyElem()
+        elem = self._TIMEOUT_THEN_ELEM[1]
         # Simula first call raising, second call returning element
-        mock_wait.return_value.until.side_effect = [TimeoutException(), elem]
+        mock_wait.return_value.until.side_effect = iter(self._TIMEOUT_THEN_ELEM)
         # Simula scroll finds element by returning element on find_element(ANDROID_UIAUTOMATOR)
         self.mock_driver.find_element.return_value = elem
         with patch.object(self.page, "_scroll_to_element_by_id", return_value=True) as mock_scroll:
@@ -45,6 +56,7 @@ class TestLoginTap(unittest.TestCase):
 
     @patch("pages.login_page.WebDriverWait")
     def test_tap_login_failure_capture(self, mock_wait):
+        from selenium.common.exceptions import TimeoutException
         # Both attempts TimeoutException
         mock_wait.return_value.until.side_effect = TimeoutException()
         with patch.object(self.page, "_scroll_to_element_by_id", return_value=False):
@@ -6,18 +6,16 @@ para abrir o menu + abrir login quando a primeira tentativa de inserir
 username falha com TimeoutException.
 </summary>
 """
-from unittest.mock import Mock
+from unittest.mock import NonCallableMock
 import pytest
-from selenium.common.exceptions import TimeoutException
+
+from pages.login_page import LoginPage
+from tests.utils.dummies import DummyContext
 
 # Importa o step que vamos testar
 from features.steps.login_steps import step_enter_credentials
 
 
-class DummyContext:
-    pass
-
-
 def test_step_enter_credentials_falls_back_to_menu():
     """
     <summary>
@@ -28,8 +26,9 @@ def test_step_enter_credentials_falls_back_to_menu():
       - chame enter_username() e enter_password() novamente (segunda vez succeeds)
     </summary>
     """
+    from selenium.common.exceptions import TimeoutException
     ctx = DummyContext()
-    mock_page = Mock()
+    mock_page = NonCallableMock(spec=LoginPage)
 
     # Configura enter_username para falhar na primeira chamada e ter sucesso na segunda
     mock_page.enter_username.side_effect = [TimeoutException("initial timeout"), None]
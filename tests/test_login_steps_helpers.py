@@ -6,25 +6,24 @@ Usam mocks para isolar IO/sistema.
 </summary>
 """
 import os
-import importlib.util
 import unittest
 from unittest.mock import patch, Mock
+from tests.utils.alias_helper import LOGIN_STEPS_PATH
+from tests.utils.load_module import load_module
+from tests.utils.side_effects import dict_side_effect
 
-
-def load_module(path):
-    spec = importlib.util.spec_from_file_location("features.steps.login_steps", path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
+# Respostas pré-calculadas para requests.get: base sem /wd/hub falha, /wd/hub responde 200
+_WD_HUB_ONLY_RESPONSES = {
+    "http://localhost:4723/status": Exception("fail"),
+    "http://localhost:4723/wd/hub/status": Mock(status_code=200),
+}
 
 
 class TestLoginStepsHelpers(unittest.TestCase):
-    def setUp(self):
-        base_dir = os.path.abspath(importlib.util.find_spec("os").origin)
-        # Ajuste do caminho do módulo para carregar a partir da pasta do projecto
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        steps_path = os.path.join(project_root, "features", "steps", "login_steps.py")
-        self.mod = load_module(steps_path)
+    @classmethod
+    def setUpClass(cls):
+        # load_module reaproveita o módulo em cache se já carregado por outra classe
+        cls.mod = load_module(LOGIN_STEPS_PATH, module_name="features.steps.login_steps")
 
     @patch.dict(os.environ, {}, clear=True)
     @patch("shutil.which", return_value=None)
@@ -53,11 +52,7 @@ class TestLoginStepsHelpers(unittest.TestCase):
     @patch("requests.get")
     def test_detect_appium_endpoint_fallback(self, mock_get):
         # Primeiro falha, segundo OK (com /wd/hub)
-        def side_effect(url, timeout):
-            if "/wd/hub" in url:
-                return Mock(status_code=200)
-            raise Exception("fail")
-        mock_get.side_effect = side_effect
+        mock_get.side_effect = dict_side_effect(_WD_HUB_ONLY_RESPONSES)
         endpoint = self.mod._detect_appium_endpoint("http://localhost:4723")
         self.assertTrue(endpoint.endswith("/wd/hub"))
 
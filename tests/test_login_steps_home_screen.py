@@ -22,13 +22,13 @@ class DummyWait:
     chamada configurada (success_call_index) ou sempre levantará TimeoutException.
     </summary>
     """
-    calls = []            # lista para contar instâncias criadas
+    calls = 0             # contador de instâncias criadas
     success_call_index = None  # índice (1-based) da instância que deverá ter sucesso
 
     def __init__(self, driver, timeout):
         # registra a criação da instância e armazena seu índice (1-based)
-        DummyWait.calls.append(1)
-        self._index = len(DummyWait.calls)
+        DummyWait.calls += 1
+        self._index = DummyWait.calls
 
     def until(self, condition):
         # Se success_call_index coincide com este índice, simula sucesso
@@ -41,10 +41,10 @@ class DummyWait:
 @pytest.fixture(autouse=True)
 def reset_dummy():
     # reseta estado do DummyWait antes de cada teste
-    DummyWait.calls.clear()
+    DummyWait.calls = 0
     DummyWait.success_call_index = None
     yield
-    DummyWait.calls.clear()
+    DummyWait.calls = 0
     DummyWait.success_call_index = None
 
 
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+<summary>
+Testes unitários para features/steps/login_steps.py (consolidam os antigos
+test_login_steps.py e test_login_steps_generated.py).
+Cobrem com mocks (check_android_environment e _detect_appium_endpoint ficam em
+test_login_steps_helpers.py):
+- step_open_app (parametrizado: options disponível e fallback; erro quando ambiente inválido)
+- step_enter_credentials, step_click_login (verifica delegação ao Page Object)
+- step_verify_home_screen (mocka WebDriverWait)
+</summary>
+"""
+import sys
+from unittest.mock import patch, Mock, NonCallableMock
+import pytest
+# Importa o utilitário load_module que garante registrar o módulo com o nome canônico em sys.modules
+from tests.utils.load_module import load_module
+from tests.utils.alias_helper import LOGIN_STEPS_PATH
+from pages.login_page import LoginPage
+
+# Templates de Mock (driver e Page Object) construídos uma vez e reiniciados por teste.
+# O Page Object usa spec=LoginPage: atributos inexistentes (typos) falham de imediato.
+_DRIVER_TEMPLATE = Mock(spec_set=["find_element", "find_elements", "get_screenshot_as_file", "page_source", "quit"])
+_PAGE_TEMPLATE = NonCallableMock(spec=LoginPage)
+
+
+@pytest.fixture(scope="module")
+def _steps_module():
+    """
+    <summary>
+    Carrega o módulo de steps uma única vez para todo o ficheiro de testes
+    (na primeira utilização, não durante a coleta).
+    </summary>
+    """
+    return load_module(LOGIN_STEPS_PATH, module_name="features.steps.login_steps")
+
+
+@pytest.fixture(autouse=True)
+def steps(_steps_module, monkeypatch):
+    """
+    <summary>
+    Garante que sys.modules aponte para o módulo carregado durante cada teste: outros módulos
+    de teste podem ter registrado outra instância sob 'features.steps.login_steps', e os
+    @patch('features.steps.login_steps.X') precisam atingir o módulo usado aqui.
+    O valor anterior é restaurado no teardown (monkeypatch.setitem).
+    </summary>
+    """
+    monkeypatch.setitem(sys.modules, "features.steps.login_steps", _steps_module)
+    return _steps_module
+
+
+@pytest.fixture
+def mock_driver():
+    """Template de driver reiniciado para o teste corrente."""
+    _DRIVER_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    return _DRIVER_TEMPLATE
+
+
+@pytest.fixture
+def mock_page():
+    """Template de Page Object reiniciado para o teste corrente."""
+    _PAGE_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    return _PAGE_TEMPLATE
+
+
+# Tests for step_open_app flows
+@patch("features.steps.login_steps.check_android_environment", return_value=(False, {"notes": "missing adb"}))
+@patch("features.steps.login_steps.webdriver.Remote")
+def test_step_open_app_fails_when_env_bad(mock_remote, mock_check_env, ctx, steps):
+    """
+    <summary>
+    Simula ambiente inválido e espera que step_open_app levante RuntimeError sem criar sessão.
+    </summary>
+    """
+    with pytest.raises(RuntimeError):
+        steps.step_open_app(ctx)
+    mock_remote.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "has_options, expected_kwarg",
+    [(True, "options"), (False, "desired_capabilities")],
+    ids=["options", "desired_caps"],
+)
+@patch("features.steps.login_steps.check_android_environment", return_value=(True, {"notes": ""}))
+@patch("features.steps.login_steps._detect_appium_endpoint", return_value="http://localhost:4723")
+@patch("features.steps.login_steps.webdriver.Remote")
+@patch("features.steps.login_steps.UiAutomator2Options")
+def test_step_open_app_builds_remote(mock_opts_cls, mock_remote, mock_detect, mock_check_env, mock_driver, has_options, expected_kwarg, ctx, steps):
+    """
+    <summary>
+    Verifica que webdriver.Remote recebe 'options' quando UiAutomator2Options está disponível
+    e 'desired_capabilities' no fallback; em ambos os casos o APK é informado.
+    </summary>
+    """
+    mock_opts_cls.return_value = Mock()
+    mock_remote.return_value = mock_driver
+
+    with patch.object(steps, "_HAS_UIAUTOMATOR2_OPTIONS", has_options):
+        steps.step_open_app(ctx)
+
+    assert ctx.driver is mock_driver
+    mock_remote.assert_called()
+    _, kwargs = mock_remote.call_args
+    assert expected_kwarg in kwargs
+    if has_options:
+        assert hasattr(kwargs["options"], "app")
+    else:
+        assert "app" in kwargs["desired_capabilities"]
+
+
+# Tests for delegation steps
+def test_step_enter_credentials_and_click_delegation(mock_page, ctx, steps):
+    """
+    <summary>
+    Verifica que step_enter_credentials e step_click_login delegam ao Page Object.
+    </summary>
+    """
+    ctx.login_page = mock_page
+
+    steps.step_enter_credentials(ctx, "user1", "pass1")
+    mock_page.enter_username.assert_called_once_with("user1")
+    mock_page.enter_password.assert_called_once_with("pass1")
+
+    steps.step_click_login(ctx)
+    mock_page.tap_login.assert_called_once()
+
+
+@patch("features.steps.login_steps.WebDriverWait")
+def test_step_verify_home_screen_waits(mock_wait, mock_driver, ctx, steps):
+    """
+    <summary>
+    Verifica que step_verify_home_screen usa WebDriverWait e chama until().
+    </summary>
+    """
+    ctx.driver = mock_driver
+    # Configura WebDriverWait(...).until(...) para retornar um mock (sem exceção)
+    mock_wait.return_value.until.return_value = Mock()
+
+    # Executa (deve terminar sem exceção)
+    steps.step_verify_home_screen(ctx)
+
+    # Verifica que o WebDriverWait foi usado
+    mock_wait.assert_called()
@@ -6,7 +6,6 @@ Cobre caminho direto (login() bem-sucedido) e caminho de fallback quando login()
 </summary>
 """
 from types import SimpleNamespace
-from unittest.mock import Mock
 import pytest
 from selenium.common.exceptions import TimeoutException
 
@@ -14,22 +13,44 @@ from selenium.common.exceptions import TimeoutException
 from features.steps.product_steps import step_logged_in
 
 
+class FakePage:
+    """
+    <summary>
+    Page Object de login mínimo que apenas registra as chamadas recebidas.
+    Se login_error for informado, login() o levanta (após registrar a chamada).
+    </summary>
+    """
+    __slots__ = ("login_calls", "menu_calls", "login_error")
+
+    def __init__(self, login_error=None):
+        self.login_calls = []
+        self.menu_calls = []
+        self.login_error = login_error
+
+    def login(self, usuario, senha):
+        self.login_calls.append((usuario, senha))
+        if self.login_error is not None:
+            raise self.login_error
+
+    def login_via_menu(self, usuario, senha):
+        self.menu_calls.append((usuario, senha))
+
+
 def test_step_logged_in_calls_login_when_succeeds():
     """
     <summary>
     Quando login() funciona sem erro, login_via_menu() não deve ser chamado.
     </summary>
     """
-    ctx = SimpleNamespace()
-    mock_page = Mock()
-    ctx.login_page = mock_page
+    page = FakePage()
+    ctx = SimpleNamespace(login_page=page)
 
     # Executa o step
     step_logged_in(ctx, "usuario@test.com", "senha123")
 
     # Valida que login foi chamado e fallback não
-    mock_page.login.assert_called_once_with("usuario@test.com", "senha123")
-    mock_page.login_via_menu.assert_not_called()
+    assert page.login_calls == [("usuario@test.com", "senha123")]
+    assert page.menu_calls == []
 
 
 def test_step_logged_in_falls_back_to_menu_when_login_timeout():
@@ -39,15 +60,13 @@ def test_step_logged_in_falls_back_to_menu_when_login_timeout():
     que login_via_menu() é chamado como fallback.
     </summary>
     """
-    ctx = SimpleNamespace()
-    mock_page = Mock()
     # Simula TimeoutException ao chamar login()
-    mock_page.login.side_effect = TimeoutException("timeout")
-    ctx.login_page = mock_page
+    page = FakePage(login_error=TimeoutException("timeout"))
+    ctx = SimpleNamespace(login_page=page)
 
     # Executa o step
     step_logged_in(ctx, "usuario@test.com", "senha123")
 
     # Valida que login foi chamado e que fallback (login_via_menu) também foi invocado
-    mock_page.login.assert_called_once_with("usuario@test.com", "senha123")
-    mock_page.login_via_menu.assert_called_once_with("usuario@test.com", "senha123")
+    assert page.login_calls == [("usuario@test.com", "senha123")]
+    assert page.menu_calls == [("usuario@test.com", "senha123")]
@@ -1,49 +1,10 @@
 #!/usr/bin/env python3
 import pytest
-import time
-from unittest.mock import MagicMock
-from selenium.common.exceptions import NoSuchElementException
-from appium.webdriver.common.appiumby import AppiumBy
+from itertools import chain, repeat
+from types import SimpleNamespace
 
 from pages.product_page import ProductPage
 
-class FakeElement:
-    def __init__(self, text=""):
-        self.text = text
-    def click(self): pass
-    def find_element(self, by, value):
-        if "TextView" in value:
-            return self
-        raise NoSuchElementException()
-
-class FakeDriver:
-    def __init__(self, pages):
-        self.pages = pages
-        self.current = 0
-
-    def find_elements(self, by, value):
-        if by == AppiumBy.ID and value == "com.saucelabs.mydemoapp.android:id/productTV":
-            return [FakeElement("Products")]
-        if by == AppiumBy.XPATH and "ImageView" in value:
-            return [FakeElement(t) for t in self.pages[self.current]]
-        return []
-
-    def find_element(self, by, value):
-        if by == AppiumBy.ANDROID_UIAUTOMATOR and "scrollForward" in value:
-            if self.current < len(self.pages)-1:
-                self.current += 1
-                return FakeElement("scrolled")
-            raise NoSuchElementException()
-        if by == AppiumBy.XPATH:
-            import re
-            m = re.search(r"\)\[(\d+)\]$", value)
-            if m:
-                idx = int(m.group(1)) - 1
-                page = self.pages[self.current]
-                if 0 <= idx < len(page):
-                    return FakeElement(page[idx])
-                raise NoSuchElementException()
-        raise NoSuchElementException()
 
 def test_collect_product_titles_and_compare(monkeypatch):
     """
@@ -51,8 +12,8 @@ def test_collect_product_titles_and_compare(monkeypatch):
     Garante que collect_product_titles acumula títulos após múltiplos scrolls e que compare_products usa esses títulos.
     </summary>
     """
-    driver = MagicMock()
-    pp = ProductPage(driver)
+    # Driver nunca é usado (métodos da página são monkeypatchados); um namespace vazio basta
+    pp = ProductPage(SimpleNamespace())
 
     # Simula sequência de visibilidade: primeiro header-like, depois páginas com novos títulos
     seq = [
@@ -60,22 +21,13 @@ def test_collect_product_titles_and_compare(monkeypatch):
         ["P1"],              # após 1º scroll
         ["P1", "P2", "P3"],  # após 2º scroll (novos)
     ]
-    calls = {"i": 0}
-    def fake_get_all():
-        i = calls["i"]
-        calls["i"] += 1
-        # quando ultrapassa seq retorna última entrada repetida
-        return seq[min(i, len(seq)-1)]
-    monkeypatch.setattr(pp, "get_all_product_titles", fake_get_all)
+    # quando ultrapassa seq retorna última entrada repetida
+    gen = chain(seq, repeat(seq[-1]))
+    monkeypatch.setattr(pp, "get_all_product_titles", lambda: next(gen))
 
     # Simula 2 scrolls com sucesso e depois False
-    sc_seq = [True, True, False]
-    sc_calls = {"i":0}
-    def fake_scroll():
-        i = sc_calls["i"]
-        sc_calls["i"] += 1
-        return sc_seq[min(i, len(sc_seq)-1)]
-    monkeypatch.setattr(pp, "_scroll_forward", fake_scroll)
+    scroll_gen = chain([True, True], repeat(False))
+    monkeypatch.setattr(pp, "_scroll_forward", lambda: next(scroll_gen))
 
     titles = pp.collect_product_titles(min_count=3, max_scrolls=4, wait_after_scroll=0)
     # verificações básicas: acumulou ao menos 3 títulos
@@ -91,8 +43,8 @@ def test_collect_all_instances_includes_duplicates(monkeypatch):
     Verifica que collect_product_titles pode incluir duplicatas (quando a viewport repete itens).
     </summary>
     """
-    driver = MagicMock()
-    pp = ProductPage(driver)
+    # Driver nunca é usado (métodos da página são monkeypatchados); um namespace vazio basta
+    pp = ProductPage(SimpleNamespace())
 
     # Simula repetição: P1 aparece duas vezes nas visíveis
     seq = [
@@ -101,12 +53,8 @@ def test_collect_all_instances_includes_duplicates(monkeypatch):
         ["P1", "P2"],
         ["P2", "P3"]
     ]
-    calls = {"i":0}
-    def fake_get_all():
-        i = calls["i"]
-        calls["i"] += 1
-        return seq[min(i, len(seq)-1)]
-    monkeypatch.setattr(pp, "get_all_product_titles", fake_get_all)
+    gen = chain(seq, repeat(seq[-1]))
+    monkeypatch.setattr(pp, "get_all_product_titles", lambda: next(gen))
 
     # scrolls suficientes
     monkeypatch.setattr(pp, "_scroll_forward", lambda: True)
@@ -122,8 +70,8 @@ def test_compare_uses_cached_titles_after_collect(monkeypatch):
     Confirma que compare_products reutiliza self._last_collected_titles quando suficientes.
     </summary>
     """
-    driver = MagicMock()
-    pp = ProductPage(driver)
+    # Driver nunca é usado (métodos da página são monkeypatchados); um namespace vazio basta
+    pp = ProductPage(SimpleNamespace())
 
     # Configura cache direto
     pp._last_collected_titles = ["X", "Y", "Z", "W", "V", "U"]
@@ -139,3 +87,24 @@ def test_compare_uses_cached_titles_after_collect(monkeypatch):
     assert called["collect"] is False
     assert res["product_a"] == "Y"
     assert res["product_b"] == "V"
+
+
+def test_collect_stops_scrolling_once_min_count_reached(monkeypatch):
+    """
+    <summary>
+    collect_product_titles encerra assim que min_count é atingido (sem scrolls extras)
+    e não chama time.sleep quando wait_after_scroll é 0.
+    </summary>
+    """
+    pp = ProductPage(SimpleNamespace())
+    gen = chain([["Products"], ["P1"], ["P2", "P3"]], repeat(["P4"]))
+    monkeypatch.setattr(pp, "get_all_product_titles", lambda: next(gen))
+    scrolls = []
+    monkeypatch.setattr(pp, "_scroll_forward", lambda: scrolls.append(1) or True)
+    sleeps = []
+    monkeypatch.setattr("pages.product_page.time.sleep", sleeps.append)
+
+    titles = pp.collect_product_titles(min_count=3, max_scrolls=6, wait_after_scroll=0)
+    assert titles == ["P1", "P2", "P3"]
+    assert len(scrolls) == 2
+    assert sleeps == []
@@ -9,31 +9,37 @@ Cobre:
 </summary>
 """
 import os
+import shutil
 import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 import logging
 import pytest
 from pages.product_page import ProductPage
 
+
+def _logged(caplog, *needles: str) -> bool:
+    """
+    <summary>
+    Indica se algum registro capturado contém algum dos fragmentos; para no primeiro acerto,
+    sem juntar todas as mensagens numa única string.
+    </summary>
+    """
+    return any(n in rec.message for rec in caplog.records for n in needles)
+
 def test_capture_debug_artifacts_writes_files_and_logs(tmp_path, caplog, monkeypatch):
     """
     <summary>
     Valida que _capture_debug_artifacts grava um PNG e um XML no diretório artifacts e emite logs debug.
     </summary>
     """
-    # Garante que logs debug do módulo sejam capturados
-    caplog.set_level(logging.DEBUG)
+    # Garante que logs debug de pages.* (ProductPage e gravador) sejam capturados, sem ligar DEBUG nos demais loggers
+    caplog.set_level(logging.DEBUG, logger="pages")
 
-    # Criamos um fake driver com page_source e get_screenshot_as_file
+    # Criamos um fake driver com page_source e get_screenshot_as_png (bytes do screenshot)
     driver = MagicMock()
     driver.page_source = "<hierarchy><node text='X'/></hierarchy>"
-
-    # Implementa get_screenshot_as_file para escrever um ficheiro simples
-    def fake_screenshot(path):
-        with open(path, "wb") as f:
-            f.write(b"PNG-DATA")
-        return True
-    driver.get_screenshot_as_file.side_effect = fake_screenshot
+    driver.get_screenshot_as_png.return_value = b"PNG-DATA"
 
     pp = ProductPage(driver)
 
@@ -43,42 +49,50 @@ def test_capture_debug_artifacts_writes_files_and_logs(tmp_path, caplog, monkeyp
     # Chama a captura com prefixo conhecido
     prefix = "unit_test_capture"
     pp._capture_debug_artifacts(prefix=prefix)
+    # A gravação ocorre em background; aguarda antes de inspecionar o disco
+    pp._flush_artifacts()
 
     # Confirma existência de ficheiros no diretório artifacts
     artifacts_dir = tmp_path / "artifacts"
     assert artifacts_dir.exists() and artifacts_dir.is_dir()
 
-    files = list(artifacts_dir.iterdir())
-    # Deve ter pelo menos 2 ficheiros (png + xml)
-    assert any(f.suffix == ".png" and prefix in f.name for f in files)
-    assert any(f.suffix == ".xml" and prefix in f.name for f in files)
+    # Deve ter pelo menos 2 ficheiros (png + xml) com o prefixo: uma única passagem pelo diretório
+    found_png = found_xml = False
+    with os.scandir(artifacts_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if prefix in name:
+                if name.endswith(".png"):
+                    found_png = True
+                elif name.endswith(".xml"):
+                    found_xml = True
+    assert found_png and found_xml
 
     # Verifica que logs debug com as mensagens esperadas estão presentes
     # (procuramos por fragmentos que o método registra)
-    msgs = "\n".join(rec.message for rec in caplog.records)
-    assert "Screenshot salvo em" in msgs or "get_screenshot_as_file" in msgs
-    assert "Page source salvo em" in msgs or "page_source vazio" in msgs
+    assert _logged(caplog, "Screenshot salvo em", "get_screenshot_as_png")
+    assert _logged(caplog, "Page source salvo em", "page_source vazio")
 
 def test_capture_debug_artifacts_handles_screenshot_failure(tmp_path, caplog, monkeypatch):
     """
     <summary>
-    Garante que se driver.get_screenshot_as_file lançar exceção, o método não propaga e grava page_source quando possível.
+    Garante que se driver.get_screenshot_as_png lançar exceção, o método não propaga e grava page_source quando possível.
     </summary>
     """
-    caplog.set_level(logging.DEBUG)
+    # A falha do screenshot é registrada com logger.exception (ERROR); DEBUG não é necessário
+    caplog.set_level(logging.ERROR, logger="pages.product_page")
     driver = MagicMock()
     driver.page_source = "<hierarchy>OK</hierarchy>"
 
     # screenshot lança exceção
-    def fake_screenshot_fail(path):
-        raise RuntimeError("simulated screenshot failure")
-    driver.get_screenshot_as_file.side_effect = fake_screenshot_fail
+    driver.get_screenshot_as_png.side_effect = RuntimeError("simulated screenshot failure")
 
     pp = ProductPage(driver)
     monkeypatch.chdir(tmp_path)
 
     # Deve não levantar
     pp._capture_debug_artifacts(prefix="failure_case")
+    pp._flush_artifacts()
 
     artifacts_dir = tmp_path / "artifacts"
     # Mesmo que screenshot falhe, page_source deve ter sido tentado salvo (ou no mínimo não propagou)
@@ -87,5 +101,111 @@ def test_capture_debug_artifacts_handles_screenshot_failure(tmp_path, caplog, mo
     # Pode ter só xml se o png falhou; garantimos que pelo menos um .xml existe
     assert any(f.suffix == ".xml" for f in files)
     # Verifica logs de exceção para screenshot
-    msgs = "\n".join(rec.message for rec in caplog.records)
-    assert "Falha ao salvar screenshot" in msgs or "get_screenshot_as_file" in msgs
\ No newline at end of file
+    assert _logged(caplog, "Falha ao salvar screenshot", "get_screenshot_as_png")
+
+def test_capture_debug_artifacts_falls_back_to_screenshot_as_file(tmp_path, monkeypatch):
+    """
+    <summary>
+    Drivers sem get_screenshot_as_png continuam a gravar o PNG via get_screenshot_as_file.
+    </summary>
+    """
+    def fake_screenshot(path):
+        with open(path, "wb") as f:
+            f.write(b"PNG-DATA")
+        return True
+    driver = SimpleNamespace(page_source="<hierarchy/>", get_screenshot_as_file=fake_screenshot)
+
+    pp = ProductPage(driver)
+    monkeypatch.chdir(tmp_path)
+    pp._capture_debug_artifacts(prefix="as_file")
+    pp._flush_artifacts()
+
+    files = list((tmp_path / "artifacts").iterdir())
+    assert any(f.suffix == ".png" and f.read_bytes() == b"PNG-DATA" for f in files)
+    assert any(f.suffix == ".xml" for f in files)
+
+
+def test_capture_debug_artifacts_emits_single_debug_record(tmp_path, caplog, monkeypatch):
+    """
+    <summary>
+    Uma captura bem-sucedida resume screenshot e page_source num único registro debug.
+    </summary>
+    """
+    caplog.set_level(logging.DEBUG, logger="pages._artifact_writer")
+    driver = SimpleNamespace(page_source="<hierarchy/>", get_screenshot_as_png=lambda: b"PNG-DATA")
+    pp = ProductPage(driver)
+    monkeypatch.chdir(tmp_path)
+    pp._capture_debug_artifacts(prefix="single_record")
+    pp._flush_artifacts()
+
+    records = [rec.message for rec in caplog.records if rec.name == "pages._artifact_writer"]
+    assert len(records) == 1
+    assert "Screenshot salvo em" in records[0] and "Page source salvo em" in records[0]
+
+
+def test_capture_debug_artifacts_consecutive_captures_do_not_overwrite(tmp_path, monkeypatch):
+    """
+    <summary>
+    Duas capturas seguidas com o mesmo prefixo geram ficheiros distintos (pid + contador).
+    </summary>
+    """
+    driver = SimpleNamespace(page_source="<hierarchy/>", get_screenshot_as_png=lambda: b"PNG-DATA")
+    pp = ProductPage(driver)
+    monkeypatch.chdir(tmp_path)
+    pp._capture_debug_artifacts(prefix="twice")
+    pp._capture_debug_artifacts(prefix="twice")
+    pp._flush_artifacts()
+
+    pngs = [f for f in (tmp_path / "artifacts").iterdir() if f.suffix == ".png"]
+    assert len(pngs) == 2
+    assert all(f.name.startswith(f"twice_{os.getpid()}_") for f in pngs)
+
+
+def test_capture_debug_artifacts_reads_pid_per_capture(product_page, monkeypatch):
+    """
+    <summary>
+    O pid do nome é lido no momento da captura (um filho criado por fork não repete o do pai).
+    </summary>
+    """
+    pp, driver = product_page
+    driver.get_screenshot_as_png.return_value = b"PNG"
+    driver.page_source = "<hierarchy/>"
+    batches = []
+    monkeypatch.setattr("pages._artifact_writer.submit_many", batches.append)
+    monkeypatch.setattr(os, "getpid", lambda: 424242)
+
+    pp._capture_debug_artifacts(prefix="forked")
+
+    assert all(os.path.basename(path).startswith("forked_424242_") for _, path, _ in batches[0])
+
+
+def _write_png_file(path):
+    # get_screenshot_as_file de teste: grava o PNG como o driver real faria
+    with open(path, "wb") as f:
+        f.write(b"PNG-DATA")
+    return True
+
+
+@pytest.mark.parametrize("screenshot_api", [
+    {"get_screenshot_as_png": lambda: b"PNG-DATA"},
+    {"get_screenshot_as_file": _write_png_file},
+], ids=["as_png", "as_file"])
+def test_capture_debug_artifacts_recreates_removed_artifacts_dir(tmp_path, monkeypatch, screenshot_api):
+    """
+    <summary>
+    Se o diretório artifacts for apagado depois da primeira captura, a seguinte volta a criá-lo,
+    tanto na gravação em background (as_png) como no fallback síncrono (as_file).
+    </summary>
+    """
+    driver = SimpleNamespace(page_source="<hierarchy/>", **screenshot_api)
+    pp = ProductPage(driver)
+    monkeypatch.chdir(tmp_path)
+    pp._capture_debug_artifacts(prefix="first")
+    pp._flush_artifacts()
+    shutil.rmtree(tmp_path / "artifacts")
+
+    pp._capture_debug_artifacts(prefix="second")
+    pp._flush_artifacts()
+
+    names = {f.suffix for f in (tmp_path / "artifacts").iterdir() if f.name.startswith("second_")}
+    assert names == {".png", ".xml"}
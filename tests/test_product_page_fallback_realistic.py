@@ -8,16 +8,9 @@ Valida fallback robusto de get_all_product_titles:
 """
 from unittest.mock import MagicMock
 from appium.webdriver.common.appiumby import AppiumBy
-from pages.product_page import ProductPage
 
-def make_el(text):
-    e = MagicMock()
-    type(e).text = text
-    return e
-
-def test_get_all_product_titles_prefers_title_elements():
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test_get_all_product_titles_prefers_title_elements(product_page, make_el):
+    pp, driver = product_page
 
     # Simula primeira tentativa por PRODUCT_TITLE retornando header-like
     header = make_el("Products")
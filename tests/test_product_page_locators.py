@@ -11,17 +11,9 @@ Cobrem:
 from unittest.mock import MagicMock
 import pytest
 from appium.webdriver.common.appiumby import AppiumBy
-from pages.product_page import ProductPage
 
-def make_elem_with_text(text):
-    """Helper: cria um MagicMock WebElement com atributo .text"""
-    e = MagicMock()
-    type(e).text = text
-    return e
-
-def test_select_product_by_image_index_uses_instance_selector():
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test_select_product_by_image_index_uses_instance_selector(product_page):
+    pp, driver = product_page
 
     # Mock do elemento retornado pelo find_element
     elem = MagicMock()
@@ -38,27 +30,21 @@ def test_select_product_by_image_index_uses_instance_selector():
     elem.click.assert_called_once()
     assert returned is elem
 
-def test_get_all_product_titles_fallback_uses_android_uiautomator_and_extracts_titles():
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test_get_all_product_titles_fallback_uses_android_uiautomator_and_extracts_titles(product_page, make_el):
+    pp, driver = product_page
 
     # 1) Simula retorno "header-like" quando o código busca por PRODUCT_TITLE (ex.: ["Products"])
-    header_elem = make_elem_with_text("Products")
+    header_elem = make_el("Products")
     # driver.find_elements será chamado primeiro com PRODUCT_TITLE e depois com ANDROID_UIAUTOMATOR
     def find_elements_side(by, val):
         if by == pp.PRODUCT_TITLE[0] and val == pp.PRODUCT_TITLE[1]:
             return [header_elem]
         if by == AppiumBy.ANDROID_UIAUTOMATOR and val == pp.PRODUCT_IMAGE_UIAUTOMATOR_BASE:
             # Cria dois "image" elements que não têm .text mas têm find_element relativo retornando TextView com text
-            img1 = MagicMock()
-            type(img1).text = ""  # sem texto direto
-            rel1 = make_elem_with_text("Image Prod 1")
-            img1.find_element.return_value = rel1
-
-            img2 = MagicMock()
-            type(img2).text = ""  # sem texto direto
-            rel2 = make_elem_with_text("Image Prod 2")
-            img2.find_element.return_value = rel2
+            rel1 = make_el("Image Prod 1")
+            img1 = make_el("", child=rel1)
+            rel2 = make_el("Image Prod 2")
+            img2 = make_el("", child=rel2)
 
             return [img1, img2]
         return []
@@ -71,9 +57,8 @@ def test_get_all_product_titles_fallback_uses_android_uiautomator_and_extracts_t
     # (o side_effect garante que a chamada foi feita conforme o branch)
     assert titles == ["Image Prod 1", "Image Prod 2"]
 
-def test__extract_title_from_image_element_prefers_direct_text_then_relatives():
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test__extract_title_from_image_element_prefers_direct_text_then_relatives(product_page, make_el):
+    pp, driver = product_page
 
     # Caso 1: imagem com texto direto
     img_with_text = MagicMock()
@@ -81,33 +66,27 @@ def test__extract_title_from_image_element_prefers_direct_text_then_relatives():
     assert pp._extract_title_from_image_element(img_with_text) == "Direct Title"
 
     # Caso 2: imagem sem text, mas find_element relativo retorna um TextView com texto
-    img_no_text = MagicMock()
-    type(img_no_text).text = ""
-    rel_elem = make_elem_with_text("Relative Title")
-    img_no_text.find_element.return_value = rel_elem
+    rel_elem = make_el("Relative Title")
+    img_no_text = make_el("", child=rel_elem)
     assert pp._extract_title_from_image_element(img_no_text) == "Relative Title"
 
-def test_get_all_product_titles_filters_header_and_uses_images():
+def test_get_all_product_titles_filters_header_and_uses_images(product_page, make_el):
     """
     <summary>
     Quando title_elems inclui um header-like na posição 0 e existem img_elems,
     o método deve ignorar esse header e extrair o título a partir do img_elems[0].
     </summary>
     """
-    driver = MagicMock()
-    pp = ProductPage(driver)
+    pp, driver = product_page
 
     # Simula primeira chamada por PRODUCT_TITLE retornando header-like
-    header = make_elem_with_text("Products")
+    header = make_el("Products")
 
     # Simula dois image elements (sem text) que têm elementos relativos com texto
-    img1 = MagicMock(); type(img1).text = ""
-    rel1 = make_elem_with_text("Image Prod 1")
-    img1.find_element.return_value = rel1
-
-    img2 = MagicMock(); type(img2).text = ""
-    rel2 = make_elem_with_text("Image Prod 2")
-    img2.find_element.return_value = rel2
+    rel1 = make_el("Image Prod 1")
+    img1 = make_el("", child=rel1)
+    rel2 = make_el("Image Prod 2")
+    img2 = make_el("", child=rel2)
 
     # Simula title_elems contendo apenas o header (ex.: primeiro call returned header)
     def find_elements_side(by, val):
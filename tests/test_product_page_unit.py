@@ -1,26 +1,42 @@
 import pytest
 from unittest.mock import MagicMock, call
-from pages.product_page import ProductPage
 from appium.webdriver.common.appiumby import AppiumBy
 
-def make_elem_with_text(text):
-    """Helper: cria um MagicMock WebElement com atributo .text"""
-    e = MagicMock()
-    type(e).text = text
-    return e
-
-def test_get_all_product_titles_direct():
-    driver = MagicMock()
+def test_get_all_product_titles_direct(product_page, make_el):
+    pp, driver = product_page
     # Simula elementos de título com textos
-    elems = [make_elem_with_text("Prod A"), make_elem_with_text("Prod B")]
+    elems = [make_el("Prod A"), make_el("Prod B")]
     driver.find_elements.return_value = elems
-    pp = ProductPage(driver)
     titles = pp.get_all_product_titles()
     assert titles == ["Prod A", "Prod B"]
     # Verifica que a chamada inicial buscou pelo locator PRODUCT_TITLE
     driver.find_elements.assert_called_with(pp.PRODUCT_TITLE[0], pp.PRODUCT_TITLE[1])
 
-def test_get_all_product_titles_fallback_to_images():
+def test_get_all_product_titles_from_page_source(product_page):
+    pp, driver = product_page
+    driver.page_source = (
+        "<hierarchy>"
+        "<android.widget.TextView class='android.widget.TextView' text='Products'/>"
+        "<android.view.ViewGroup>"
+        "<android.widget.ImageView class='android.widget.ImageView' resource-id='com.saucelabs.mydemoapp.android:id/productIV'/>"
+        "<android.widget.TextView class='android.widget.TextView' text='Sauce Lab Back Packs'/>"
+        "</android.view.ViewGroup>"
+        "<android.view.ViewGroup>"
+        "<android.widget.TextView class='android.widget.TextView' resource-id='com.saucelabs.mydemoapp.android:id/productTV' text='Sauce Lab Bike Light'/>"
+        "</android.view.ViewGroup>"
+        "</hierarchy>"
+    )
+    assert pp.get_all_product_titles() == ["Sauce Lab Back Packs", "Sauce Lab Bike Light"]
+    # Caminho rápido: nenhuma busca por elementos
+    driver.find_elements.assert_not_called()
+
+def test_get_all_product_titles_falls_back_when_page_source_invalid(product_page, make_el):
+    pp, driver = product_page
+    driver.page_source = "<hierarchy"
+    driver.find_elements.return_value = [make_el("Prod A"), make_el("Prod B")]
+    assert pp.get_all_product_titles() == ["Prod A", "Prod B"]
+
+def test_get_all_product_titles_fallback_to_images(product_page, make_el):
     """
     <summary>
     Quando a busca por PRODUCT_TITLE retornar apenas um header-like item,
@@ -28,23 +44,17 @@ def test_get_all_product_titles_fallback_to_images():
     com o selector PRODUCT_IMAGE_UIAUTOMATOR_BASE e extrair títulos relativos.
     </summary>
     """
-    driver = MagicMock()
-    pp = ProductPage(driver)
+    pp, driver = product_page
 
     # 1) Primeiro find_elements por PRODUCT_TITLE retorna um header-like (ex.: "Products")
-    header_elem = make_elem_with_text("Products")
+    header_elem = make_el("Products")
 
     # 2) Quando chamado com ANDROID_UIAUTOMATOR e o selector base retornamos "image" elements.
     # Cada "image" tem .text vazio, mas sua chamada .find_element(..., xpath_rel) retorna um TextView com texto.
-    img1 = MagicMock()
-    type(img1).text = ""
-    rel1 = make_elem_with_text("Image Prod 1")
-    img1.find_element.return_value = rel1
-
-    img2 = MagicMock()
-    type(img2).text = ""
-    rel2 = make_elem_with_text("Image Prod 2")
-    img2.find_element.return_value = rel2
+    rel1 = make_el("Image Prod 1")
+    img1 = make_el("", child=rel1)
+    rel2 = make_el("Image Prod 2")
+    img2 = make_el("", child=rel2)
 
     # implementa side_effect que responde aos dois tipos de chamada find_elements que ProductPage faz
     def find_elements_side(by, val):
@@ -63,9 +73,8 @@ def test_get_all_product_titles_fallback_to_images():
     # Esperamos os títulos extraídos a partir dos elementos relativos retornados por imgX.find_element(...)
     assert titles == ["Image Prod 1", "Image Prod 2"]
 
-def test__extract_title_from_image_element_text_and_relatives():
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test__extract_title_from_image_element_text_and_relatives(product_page, make_el):
+    pp, driver = product_page
 
     # Caso 1: imagem tem .text diretamente
     img = MagicMock()
@@ -73,22 +82,18 @@ def test__extract_title_from_image_element_text_and_relatives():
     assert pp._extract_title_from_image_element(img) == "Direct Title"
 
     # Caso 2: imagem sem text, mas find_element retorna relativo com text
-    img2 = MagicMock()
-    type(img2).text = ""
-    rel_elem = MagicMock()
-    type(rel_elem).text = "Relative Title"
+    rel_elem = make_el("Relative Title")
     # configurar find_element para retornar rel_elem para qualquer XPATH pedido
-    img2.find_element.return_value = rel_elem
+    img2 = make_el("", child=rel_elem)
     assert pp._extract_title_from_image_element(img2) == "Relative Title"
 
-def test_get_product_title_by_index_and_select_product():
-    driver = MagicMock()
+def test_get_product_title_by_index_and_select_product(product_page):
+    pp, driver = product_page
     e1 = MagicMock()
     type(e1).text = "A"
     e2 = MagicMock()
     type(e2).text = "B"
     driver.find_elements.return_value = [e1, e2]
-    pp = ProductPage(driver)
     assert pp.get_product_title_by_index(0) == "A"
     # select e click
     clicked = pp.select_product(1)
@@ -100,15 +105,14 @@ def test_get_product_title_by_index_and_select_product():
     with pytest.raises(IndexError):
         pp.select_product(-1)
 
-def test_select_product_by_image_index_calls_driver_find_element_and_click():
+def test_select_product_by_image_index_calls_driver_find_element_and_click(product_page):
     """
     <summary>
     Valida que select_product_by_image_index monta o UiSelector com .instance(index)
     e chama driver.find_element com AppiumBy.ANDROID_UIAUTOMATOR, clicando no elemento retornado.
     </summary>
     """
-    driver = MagicMock()
-    pp = ProductPage(driver)
+    pp, driver = product_page
 
     # Mock do elemento retornado pelo find_element
     elem = MagicMock()
@@ -125,9 +129,8 @@ def test_select_product_by_image_index_calls_driver_find_element_and_click():
     elem.click.assert_called_once()
     assert returned is elem
     
-def test_compare_products_uses_cache_and_collect(monkeypatch):
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test_compare_products_uses_cache_and_collect(product_page, monkeypatch):
+    pp, driver = product_page
     # define cache suficiente
     pp._last_collected_titles = ["A", "B", "C"]
     res = pp.compare_products(0, 1)
@@ -145,9 +148,8 @@ def test_compare_products_uses_cache_and_collect(monkeypatch):
     res2 = pp.compare_products(0, 1)
     assert res2["equal"] is True
 
-def test_collect_product_titles_accumulates_and_caches(monkeypatch):
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test_collect_product_titles_accumulates_and_caches(product_page, monkeypatch):
+    pp, driver = product_page
     # Simula sequência de telas visíveis após cada chamada a get_all_product_titles
     seq = [
         ["Products"],           # primeira chamada -> header-like (ignored)
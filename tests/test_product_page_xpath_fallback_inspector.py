@@ -7,19 +7,12 @@ quando productTV não está presente inicialmente.
 """
 from unittest.mock import MagicMock
 from appium.webdriver.common.appiumby import AppiumBy
-from pages.product_page import ProductPage
 
-def make_elem_with_text(text):
-    e = MagicMock()
-    type(e).text = text
-    return e
-
-def test_xpath_global_using_inspector_attributes():
-    driver = MagicMock()
-    pp = ProductPage(driver)
+def test_xpath_global_using_inspector_attributes(product_page, make_el):
+    pp, driver = product_page
 
     # 1) initial call by PRODUCT_TITLE returns only header-like -> triggers fallback
-    header = make_elem_with_text("Products")
+    header = make_el("Products")
     # We'll track calls for PRODUCT_TITLE initial vs later; simple flag on driver
     def find_elems(by, val):
         # initial PRODUCT_TITLE call
@@ -37,11 +30,31 @@ def test_xpath_global_using_inspector_attributes():
             return [img1, img2]
         # simulate the global XPATH search: if xpath contains productIV or 'Product Image', return two text nodes
         if by == AppiumBy.XPATH and ("productIV" in val or "Product Image" in val):
-            t1 = make_elem_with_text("Image Prod 1")
-            t2 = make_elem_with_text("Image Prod 2")
+            t1 = make_el("Image Prod 1")
+            t2 = make_el("Image Prod 2")
             return [t1, t2]
         return []
     driver.find_elements.side_effect = find_elems
 
     titles = pp.get_all_product_titles()
     assert titles == ["Image Prod 1", "Image Prod 2"]
+
+
+def test_global_xpath_fallback_costs_one_call_per_relation(product_page, make_el):
+    pp, driver = product_page
+    header = make_el("Products")
+    img = make_el("", child=make_el("Relative Title"))
+
+    def find_elems(by, val):
+        if by == pp.PRODUCT_TITLE[0] and val == pp.PRODUCT_TITLE[1]:
+            return [header]
+        if by == AppiumBy.ANDROID_UIAUTOMATOR and val == pp.PRODUCT_IMAGE_UIAUTOMATOR_BASE:
+            return [img]
+        # nenhuma XPath global encontra TextViews -> segue para o mapping híbrido
+        return []
+    driver.find_elements.side_effect = find_elems
+
+    assert pp.get_all_product_titles() == ["Relative Title"]
+    xpath_calls = [c for c in driver.find_elements.call_args_list if c.args[0] == AppiumBy.XPATH]
+    # resource-id e content-desc da mesma relação vão numa única consulta
+    assert [c.args[1] for c in xpath_calls] == list(pp.GLOBAL_TITLE_XPATHS)
@@ -5,30 +5,35 @@ Testes unitários para tests.utils.load_module.load_module.
 Os testes garantem que:
 - o módulo é carregado com o nome pedido;
 - sys.modules contém a entrada com esse nome;
-- FileNotFoundError é levantado para ficheiro inexistente.
+- FileNotFoundError é levantado para ficheiro inexistente;
+- cargas repetidas reaproveitam o módulo (sys.modules/cache) sem re-executá-lo.
 </summary>
 """
+import importlib
 import os
 import sys
 import unittest
+from unittest.mock import patch
 from tests.utils.load_module import load_module
 
+# Nomes registrados em sys.modules pelos testes abaixo: nome canônico, alias do conftest
+# e o nome automático de load_module para login_steps.py
+_ADDED_KEYS = ("features.steps.login_steps", "login_steps_mod", "loaded_module_login_steps")
+
 
 class TestLoadModuleUtility(unittest.TestCase):
-    def setUp(self):
-        # Caminho para o ficheiro de steps existente no projeto (assume a estrutura fornecida)
-        self.project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        self.login_steps_path = os.path.join(self.project_root, "features", "steps", "login_steps.py")
+    @classmethod
+    def setUpClass(cls):
+        # Caminho para o ficheiro de steps existente no projeto (assume a estrutura fornecida),
+        # calculado uma única vez para a classe
+        cls.project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        cls.login_steps_path = os.path.join(cls.project_root, "features", "steps", "login_steps.py")
 
     def tearDown(self):
-        # Remove entradas que possamos ter adicionado a sys.modules para evitar poluir o ambiente de testes
-        for key in list(sys.modules.keys()):
-            if key.startswith("loaded_module_") or key == "features.steps.login_steps" or key == "login_steps_mod":
-                # Não removemos módulos essenciais do sistema, apenas limpamos aliases usados por estes testes
-                try:
-                    del sys.modules[key]
-                except KeyError:
-                    pass
+        # Remove apenas as entradas que estes testes podem ter adicionado a sys.modules
+        # (pop direto por nome, sem varrer o dicionário inteiro)
+        for key in _ADDED_KEYS:
+            sys.modules.pop(key, None)
 
     def test_load_module_with_explicit_name(self):
         # Carrega o ficheiro com o nome canônico usado nos patches
@@ -47,6 +52,31 @@ class TestLoadModuleUtility(unittest.TestCase):
         fake_path = os.path.join(self.project_root, "nonexistent_abcdefg.py")
         with self.assertRaises(FileNotFoundError):
             load_module(fake_path)
+        # validate=False não faz stat: a falha vem da execução e nada fica registrado
+        with patch("os.stat", side_effect=AssertionError("stat inesperado")):
+            with self.assertRaises(FileNotFoundError):
+                load_module(fake_path, validate=False)
+        self.assertNotIn("loaded_module_nonexistent_abcdefg", sys.modules)
+
+    def test_load_module_reuses_cached_module(self):
+        # Segunda carga do mesmo ficheiro/nome deve devolver o mesmo objeto sem re-executar
+        first = load_module(self.login_steps_path, module_name="features.steps.login_steps")
+        # Simula limpeza de sys.modules por outro teste; o alias deve ser re-registrado
+        del sys.modules["features.steps.login_steps"]
+        second = load_module(self.login_steps_path, module_name="features.steps.login_steps")
+        self.assertIs(first, second)
+        self.assertIs(sys.modules["features.steps.login_steps"], second)
+
+    def test_load_module_sys_modules_hit_skips_disk(self):
+        # Módulo importado normalmente (ainda não visto por load_module): nem a adoção
+        # no cache nem as cargas seguintes tocam no disco
+        imported = importlib.import_module("features.steps.login_steps")
+        with patch("os.stat", side_effect=AssertionError("stat inesperado")), \
+                patch("os.path.getmtime", side_effect=AssertionError("stat inesperado")):
+            first = load_module(self.login_steps_path, module_name="features.steps.login_steps")
+            second = load_module(self.login_steps_path, module_name="features.steps.login_steps")
+        self.assertIs(first, imported)
+        self.assertIs(second, imported)
 
 
 if __name__ == "__main__":
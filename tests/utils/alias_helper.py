@@ -7,26 +7,39 @@ que o módulo 'features.steps.login_steps' esteja importado e também registrado
 sob o alias 'login_steps_mod'.
 </summary>
 """
-from typing import Any, List
+from typing import Any, List, Optional
+from types import ModuleType
 import importlib
+import os
 import sys
 
+_STEPS_MODULE = "features.steps.login_steps"
+# Caminho absoluto de features/steps/login_steps.py, para os testes que o carregam via load_module
+LOGIN_STEPS_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "features", "steps", "login_steps.py"))
+# Módulo resolvido na primeira chamada; reaproveitado se algum teste limpar sys.modules
+_CACHED_MOD: Optional[ModuleType] = None
+
 
 def register_login_steps_aliases() -> Any:
     """
     <summary>
     Importa o módulo 'features.steps.login_steps' e garante que ele também esteja
     disponível em sys.modules sob o alias 'login_steps_mod'. Retorna o objeto de módulo.
+    Se o módulo já estiver em sys.modules (caso usual), não passa pela maquinaria de import.
     </summary>
     <returns>
       O objeto módulo importado (module)
     </returns>
     """
-    # Importar com o nome canônico (estrutura de package deve existir: features/steps/__init__.py)
-    mod = importlib.import_module("features.steps.login_steps")
-    # Registrar alias adicional usado por alguns testes
-    sys.modules.setdefault("login_steps_mod", mod)
-    # Garante também que a chave canônica exista (defensivo)
-    sys.modules.setdefault("features.steps.login_steps", mod)
+    global _CACHED_MOD
+    # sys.modules primeiro (um dict.get); importa apenas se nunca foi carregado
+    # (estrutura de package deve existir: features/steps/)
+    mod = sys.modules.get(_STEPS_MODULE) or _CACHED_MOD or importlib.import_module(_STEPS_MODULE)
+    _CACHED_MOD = mod
+    # Registrar alias adicional usado por alguns testes; atribuição direta para que um alias
+    # antigo (outra instância do módulo) não sobreviva
+    sys.modules["login_steps_mod"] = mod
+    # Garante também que a chave canônica aponte para o mesmo módulo
+    sys.modules[_STEPS_MODULE] = mod
     # Retorna o módulo para que o chamador possa inspecioná-lo se necessário
     return mod
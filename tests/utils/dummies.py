@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+<summary>
+Dublês simples partilhados pelos testes (contexto do Behave).
+</summary>
+"""
+
+
+class DummyContext:
+    """
+    <summary>
+    Contexto mínimo para simular o context do Behave nos steps de login.
+    Usa __slots__ (sem __dict__ por instância) e pode ser reutilizado entre testes via reset().
+    Como no context do Behave, os atributos começam ausentes (slot não atribuído levanta
+    AttributeError), o que mantém coberto o caminho "sem driver" de after_scenario.
+    </summary>
+    """
+    __slots__ = ("driver", "login_page")
+
+    def reset(self) -> None:
+        """
+        <summary>
+        Remove os atributos atribuídos para que a mesma instância possa servir a outro teste.
+        </summary>
+        <returns>None</returns>
+        """
+        for name in self.__slots__:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
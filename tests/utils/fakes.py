@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+<summary>
+Dublês de driver/elemento partilhados pelos testes de ProductPage.
+FakeDriver simula dois cenários:
+  - catálogo (all_titles + visible_count): scrolls aumentam a quantidade de títulos visíveis;
+  - páginas (pages): cada scroll troca a viewport para a página seguinte, com header "Products"
+    no productTV e os títulos acessíveis via XPath de ImageView.
+</summary>
+"""
+import re
+from typing import List, Optional, Sequence
+from selenium.common.exceptions import NoSuchElementException
+from appium.webdriver.common.appiumby import AppiumBy
+
+PRODUCT_TV_ID = "com.saucelabs.mydemoapp.android:id/productTV"
+
+# Extrai o índice final de um XPath do tipo "(...)[N]"; compilado uma vez por módulo
+_XPATH_IDX_RE = re.compile(r"\)\[(\d+)\]$")
+
+
+class FakeElement:
+    """
+    <summary>
+    Elemento mínimo: expõe text, registra click() e resolve buscas relativas.
+    Se child for informado, find_element devolve-o; senão devolve o próprio elemento
+    para buscas por TextView e levanta NoSuchElementException nas demais.
+    </summary>
+    """
+    __slots__ = ("text", "clicked", "child")
+
+    def __init__(self, text: str = "", child: Optional["FakeElement"] = None) -> None:
+        self.text = text
+        self.clicked = False
+        self.child = child
+
+    def click(self) -> None:
+        # registra que o elemento foi clicado
+        self.clicked = True
+
+    def find_element(self, by, value):
+        if self.child is not None:
+            return self.child
+        if "TextView" in value:
+            return self
+        raise NoSuchElementException()
+
+
+def make_el(text: str = "", child: Optional[FakeElement] = None) -> FakeElement:
+    """
+    <summary>
+    Atalho para os testes: cria um FakeElement (substitui MagicMock com type(e).text = text).
+    </summary>
+    <param name="text">Texto exposto pelo elemento</param>
+    <param name="child">Elemento devolvido por find_element (busca relativa)</param>
+    <returns>FakeElement</returns>
+    """
+    return FakeElement(text, child)
+
+
+class FakeDriver:
+    """
+    <summary>
+    Driver minimalista suportando find_elements, find_element (scrollForward via UiAutomator e
+    XPath com índice), get_window_size, execute_script (mobile: swipe/dragGesture/scroll) e swipe legacy.
+    Os FakeElement são criados uma única vez no construtor e reaproveitados em cada busca.
+    </summary>
+    <param name="all_titles">Catálogo completo (modo catálogo)</param>
+    <param name="pages">Lista de viewports com os títulos de cada uma (modo páginas)</param>
+    <param name="visible_count">Títulos inicialmente visíveis no modo catálogo (None = todos)</param>
+    <param name="support_ui_automator">Se False, o scroll via UiAutomator levanta NoSuchElementException</param>
+    <param name="support_execute_script">Se False, execute_script levanta Exception</param>
+    """
+
+    def __init__(
+        self,
+        all_titles: Optional[Sequence[str]] = None,
+        pages: Optional[Sequence[Sequence[str]]] = None,
+        visible_count: Optional[int] = None,
+        support_ui_automator: bool = True,
+        support_execute_script: bool = True,
+    ) -> None:
+        self.all_titles: List[str] = list(all_titles or [])
+        self.visible_count = len(self.all_titles) if visible_count is None else min(visible_count, len(self.all_titles))
+        self.pages = [list(p) for p in pages] if pages is not None else None
+        self.current = 0
+        self.support_ui_automator = support_ui_automator
+        self.support_execute_script = support_execute_script
+        self.swipe_called = 0
+        self.execute_calls = []
+        self._elements = [FakeElement(t) for t in self.all_titles]
+        self._page_elements = [[FakeElement(t) for t in p] for p in (self.pages or [])]
+        self._header = [FakeElement("Products")]
+
+    def _advance(self, step: int) -> bool:
+        # Simula que o scroll trouxe mais itens: próxima página ou +step títulos visíveis
+        if self.pages is not None:
+            if self.current < len(self.pages) - 1:
+                self.current += 1
+                return True
+            return False
+        self.visible_count = min(len(self.all_titles), self.visible_count + step)
+        return True
+
+    def find_elements(self, by, value):
+        if self.pages is not None:
+            if by == AppiumBy.ID and value == PRODUCT_TV_ID:
+                return self._header[:]
+            if by == AppiumBy.XPATH and "ImageView" in value:
+                return self._page_elements[self.current][:]
+            return []
+        if by == AppiumBy.ID and value == PRODUCT_TV_ID:
+            return self._elements[: self.visible_count]
+        return []
+
+    def find_element(self, by, value):
+        if by == AppiumBy.ANDROID_UIAUTOMATOR and "scrollForward" in value:
+            if self.support_ui_automator and self._advance(2):
+                return FakeElement("scrolled")
+            raise NoSuchElementException("UiAutomator scroll not available")
+        if by == AppiumBy.XPATH:
+            m = _XPATH_IDX_RE.search(value)
+            if m:
+                idx = int(m.group(1)) - 1
+                visible = self._page_elements[self.current] if self.pages is not None else self._elements[: self.visible_count]
+                if 0 <= idx < len(visible):
+                    return visible[idx]
+                raise NoSuchElementException("XPath index out of visible range")
+        raise NoSuchElementException("not found")
+
+    def get_window_size(self):
+        return {"width": 1080, "height": 1920}
+
+    def execute_script(self, name, params=None):
+        # Registra a chamada e, se suportado, simula que o scroll trouxe +2 itens visíveis
+        self.execute_calls.append((name, params))
+        if not self.support_execute_script:
+            raise Exception("execute_script not supported")
+        self._advance(2)
+        return True
+
+    def swipe(self, sx, sy, ex, ey, duration):
+        self.swipe_called += 1
+        # cada swipe aumenta 1 item visível (simulação)
+        self._advance(1)
+        return True
@@ -3,36 +3,85 @@
 <summary>
 Utility para carregar um ficheiro Python como módulo com nome canônico em sys.modules.
 Garante que mocks/patches por string (ex.: "features.steps.login_steps") funcionem.
+Módulos já carregados são reaproveitados: primeiro via sys.modules (como o import do Python),
+depois pelo cache local (caminho + nome, validado pelo mtime do ficheiro).
 </summary>
 """
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from types import ModuleType
+import importlib.machinery
 import importlib.util
 import sys
 import os
+import stat
 
-def load_module(file_path: str, module_name: Optional[str] = None):
+# Cache de módulos já executados: (caminho absoluto, module_name) -> (mtime, módulo).
+# mtime None: módulo adotado de sys.modules ou carregado com validate=False, ou seja, sem stat;
+# reaproveitado como o import do Python faz.
+_MOD_CACHE: Dict[Tuple[str, str], Tuple[Optional[float], ModuleType]] = {}
+
+
+def load_module(file_path: str, module_name: Optional[str] = None, *, validate: bool = True):
     """
     <summary>
     Carrega 'file_path' como módulo nomeado 'module_name' e registra em sys.modules
-    antes de executar o código do ficheiro.
+    antes de executar o código do ficheiro. Se o mesmo ficheiro (não modificado) já
+    foi carregado com o mesmo nome, devolve o módulo em cache sem re-executá-lo.
+    Se sys.modules já tiver 'module_name' apontando para este mesmo ficheiro (import normal
+    ou carga anterior), esse módulo é devolvido sem nenhum acesso ao disco.
     </summary>
     <param name="file_path">Caminho para o ficheiro .py</param>
     <param name="module_name">Nome a usar em sys.modules (ex: 'features.steps.login_steps')</param>
+    <param name="validate">Se False (caminho confiável), não faz stat: não verifica existência/tipo nem o mtime
+    de um módulo em cache; um ficheiro inexistente só falha ao executar</param>
     <returns>O módulo carregado</returns>
+    <raises>FileNotFoundError se o ficheiro não existir (com validate=True, também se não for um ficheiro regular)</raises>
     """
     abs_path = os.path.abspath(file_path)
-    if not os.path.isfile(abs_path):
-        raise FileNotFoundError(f"File not found: {abs_path}")
-
     if module_name is None:
         base = os.path.splitext(os.path.basename(abs_path))[0]
         module_name = f"loaded_module_{base}"
 
-    spec = importlib.util.spec_from_file_location(module_name, abs_path)
+    key = (abs_path, module_name)
+    cached = _MOD_CACHE.get(key)
+
+    # Caminho rápido: o mesmo ficheiro já está registrado com este nome
+    loaded = sys.modules.get(module_name)
+    if loaded is not None and getattr(loaded, "__file__", None) == abs_path:
+        if cached is None or cached[1] is not loaded:
+            # Adota-o no cache (sem stat) para sobreviver a uma limpeza de sys.modules
+            _MOD_CACHE[key] = (None, loaded)
+        return loaded
+
+    mtime: Optional[float] = None
+    if validate:
+        # Um único stat: existência, tipo e mtime para validar o cache
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            raise FileNotFoundError(f"File not found: {abs_path}") from None
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"File not found: {abs_path}")
+        mtime = st.st_mtime
+
+    if cached is not None and (not validate or cached[0] in (None, mtime)):
+        # Re-registra o alias: algum teste pode ter limpo sys.modules entretanto
+        sys.modules[module_name] = cached[1]
+        return cached[1]
+
+    # Loader construído diretamente: dispensa a procura do loader pela extensão do ficheiro
+    loader = importlib.machinery.SourceFileLoader(module_name, abs_path)
+    spec = importlib.util.spec_from_file_location(module_name, abs_path, loader=loader)
     module = importlib.util.module_from_spec(spec)
 
     # Registrar no sys.modules antes de executar para permitir patch string-based funcionar
     sys.modules[module_name] = module
 
-    spec.loader.exec_module(module)
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        # Não deixa um módulo parcialmente executado registrado (ex.: ficheiro inexistente com validate=False)
+        sys.modules.pop(module_name, None)
+        raise
+    _MOD_CACHE[key] = (mtime, module)
     return module
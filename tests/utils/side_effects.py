@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+<summary>
+Helpers para construir side_effects de Mock a partir de tabelas pré-calculadas,
+evitando closures com lógica condicional dentro dos testes.
+</summary>
+"""
+from typing import Any, Callable, Mapping
+
+
+def dict_side_effect(responses: Mapping[Any, Any]) -> Callable[..., Any]:
+    """
+    <summary>
+    Cria um side_effect que resolve a resposta pelo primeiro argumento posicional
+    (ex.: a URL passada a requests.get). Se o valor mapeado for uma exceção, ela é levantada.
+    </summary>
+    <param name="responses">Mapa chave -> valor de retorno ou exceção a levantar</param>
+    <returns>Callable compatível com Mock.side_effect</returns>
+    <raises>KeyError se a chave não estiver mapeada</raises>
+    """
+    def _side_effect(key, *args, **kwargs):
+        value = responses[key]
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    return _side_effect